@@ -16,3 +16,4 @@
 
 GLOBAL_SERVICE_NAME = "gcl_looper"
 EP_GCL_LOOPER_SERVICES = "gcl_looper.launchpad.services"
+MP_CONTEXT_ENV = "GCL_LOOPER_MP_CONTEXT"
@@ -17,6 +17,7 @@
 import abc
 import logging
 import signal
+import threading
 
 LOG = logging.getLogger(__name__)
 
@@ -42,7 +43,11 @@ class AbstractService(abc.ABC):
         """Infinite loop itself"""
         try:
             self._setup()
-            if self.should_subscribe_signals:
+            # Signal handlers can be set in the main thread only
+            if (
+                self.should_subscribe_signals
+                and threading.current_thread() is threading.main_thread()
+            ):
                 self._subscribe_signals(self._get_sig_handlers())
             LOG.info("Start loop")
             self._loop()
@@ -14,19 +14,56 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from concurrent import futures
+import functools
 import multiprocessing
+from multiprocessing import connection
 import logging
-import threading
+import os
+import signal
 import sys
+import threading
+import time
 
+from gcl_looper import constants as c
 from gcl_looper.services import base
 from gcl_looper.services import basic
 
 LOG = logging.getLogger(__name__)
 
 
+def _child_entry(service):
+    """Entrypoint of child services, applies the common signal policy.
+
+    It's a module level function to be picklable for spawn/forkserver
+    contexts.
+    """
+    if threading.current_thread() is threading.main_thread():
+        # Child process: drop handlers inherited from the parent, the
+        # service subscribes its own ones on start
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+    else:
+        # Signals are handled by the main thread only, keep them there
+        signal.pthread_sigmask(
+            signal.SIG_BLOCK, {signal.SIGTERM, signal.SIGINT}
+        )
+    service.start()
+
+
 class ProcessHubService(basic.BasicService):
-    _instance_class = multiprocessing.get_context("fork").Process
+    # Multiprocessing start method, if None - it's taken from
+    # GCL_LOOPER_MP_CONTEXT env variable or the platform default
+    _mp_start_method = None
+    _forkserver_preload = ("logging", "gcl_looper.services.basic")
+    # Seconds to wait for children to stop after SIGTERM before SIGKILL
+    _shutdown_grace = 30.0
+    # Run the only basic service in the hub's process without any child
+    # processes. Its iterations are driven by the hub's loop, so the hub's
+    # iteration periods are used instead of the service's ones, and the
+    # service shares the hub's process and signal handlers. That changes
+    # behavior of existing single worker setups, so it's opt-in.
+    _inline_single_service = False
     __log_iteration__ = False
 
     def __init__(self, *args, **kwargs):
@@ -34,6 +71,27 @@ class ProcessHubService(basic.BasicService):
 
         self._services = []
         self._instances = {}
+        self._sentinel_map = {}
+        self._sentinels = ()
+        self._single_inline = False
+
+    @functools.cached_property
+    def _ctx(self):
+        # Built on demand, hubs without child processes don't need it
+        return multiprocessing.get_context(self._get_mp_start_method())
+
+    @property
+    def _instance_class(self):
+        return self._ctx.Process
+
+    def _get_mp_start_method(self):
+        start_method = self._mp_start_method or os.environ.get(
+            c.MP_CONTEXT_ENV
+        )
+        if start_method:
+            return start_method
+        # fork is unsafe with threads and copies the whole parent's heap
+        return "forkserver" if sys.platform.startswith("linux") else "spawn"
 
     def add_service(self, service):
         """Add a service to the list of services to start."""
@@ -45,20 +103,77 @@ class ProcessHubService(basic.BasicService):
             )
 
     def _iteration(self):
-        for instance in self._instances.values():
-            if not instance.is_alive():
-                LOG.error(
-                    "Child service(pid:%i) is not running, let's stop",
-                    instance.pid,
-                )
+        if self._single_inline:
+            service = self._services[0]
+            service._loop_iteration()
+            # The service may stop itself, the same as a child exits
+            if not service._enabled:
+                LOG.info("Inline service is not running, let's stop")
                 self.stop()
-                return
+            return
+
+        # Sentinels become ready only when child processes exit, so there
+        # is no need to poll each child with waitpid() on every iteration
+        ready = connection.wait(self._sentinels, timeout=0)
+        if not ready:
+            return
+
+        for sentinel in ready:
+            instance = self._sentinel_map[sentinel]
+            LOG.error(
+                "Child service(pid:%i) is not running, let's stop",
+                instance.pid,
+            )
+        self.stop()
+
+    def _preload_service_modules(self):
+        # Import services' modules once in the forkserver process, so
+        # children are forked from it with all the imports done.
+        # NOTE: The forkserver is shared by the whole process, so the preload
+        # is silently ignored if it's already running.
+        if self._ctx.get_start_method() != "forkserver":
+            return
+
+        modules = set(self._forkserver_preload)
+        modules.update(type(s).__module__ for s in self._services)
+        self._ctx.set_forkserver_preload(sorted(modules))
+
+    def _can_run_inline(self):
+        return (
+            self._inline_single_service
+            and len(self._services) == 1
+            and isinstance(self._services[0], basic.BasicService)
+        )
 
     def _setup(self):
-        for service in self._services:
-            instance = self._instance_class(target=service.start)
-            self._instances[service] = instance
-            instance.start()
+        if self._can_run_inline():
+            LOG.info("Run the only service inline")
+            self._single_inline = True
+            self._services[0]._setup()
+            # Normally it's set by the service's own loop
+            self._services[0]._enabled = True
+            return
+
+        self._preload_service_modules()
+        try:
+            for service in self._services:
+                instance = self._instance_class(
+                    target=_child_entry, args=(service,)
+                )
+                # Services are pickled on start, it may fail
+                instance.start()
+                self._instances[service] = instance
+        except Exception:
+            LOG.exception("Failed to start child services, let's stop")
+            self.stop()
+            raise
+
+        self._sentinel_map = {
+            instance.sentinel: instance
+            for instance in self._instances.values()
+        }
+        # Rebuild it if instances are changed
+        self._sentinels = tuple(self._sentinel_map)
 
     def _stop_instance(self, service, instance):
         LOG.info("Stop child service(pid:%i)", instance.pid)
@@ -69,25 +184,96 @@ class ProcessHubService(basic.BasicService):
                 "Failed to terminate child service, pid:%i", instance.pid
             )
 
+    def _finish(self):
+        if self._single_inline:
+            self._services[0]._finish()
+        super()._finish()
+
     def stop(self):
         LOG.info("Stop service")
         self._enabled = False
+        if self._single_inline:
+            self._services[0].stop()
+            return
+
         # Stop all managed services
         for service, instance in self._instances.items():
             self._stop_instance(service, instance)
+
+        deadline = time.monotonic() + self._shutdown_grace
+        for instance in self._instances.values():
+            instance.join(timeout=max(deadline - time.monotonic(), 0))
+
         for instance in self._instances.values():
-            instance.join()
+            if instance.is_alive():
+                LOG.warning(
+                    "Child service(pid:%i) didn't stop in %.1fs, kill it",
+                    instance.pid,
+                    self._shutdown_grace,
+                )
+                instance.kill()
+                instance.join()
 
 
 class ThreadHubService(ProcessHubService):
-    _instance_class = threading.Thread
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool = None
+
+    def _iteration(self):
+        # Threads don't have sentinels, so check their futures
+        for service, future in self._instances.items():
+            if not future.done():
+                continue
+
+            if future.exception() is not None:
+                LOG.error(
+                    "Child service(%s) failed, let's stop",
+                    service.__class__.__name__,
+                    exc_info=future.exception(),
+                )
+            else:
+                LOG.error(
+                    "Child service(%s) is not running, let's stop",
+                    service.__class__.__name__,
+                )
+            self.stop()
+            return
 
     def _setup(self):
-        # Threads can't hangle signals so we need to disable them
+        # Every service runs an infinite loop and occupies a worker for
+        # its whole lifetime, so the pool must fit all of them
+        self._pool = futures.ThreadPoolExecutor(
+            max_workers=max(len(self._services), 1),
+            thread_name_prefix=self.__class__.__name__,
+        )
         for service in self._services:
-            service.should_subscribe_signals = False
-        super()._setup()
+            self._instances[service] = self._pool.submit(_child_entry, service)
 
     def _stop_instance(self, service, instance):
-        LOG.info("Stop child service(native_id:%i)", instance.native_id)
+        LOG.info("Stop child service(%s)", service.__class__.__name__)
         service.stop()
+
+    def stop(self):
+        LOG.info("Stop service")
+        self._enabled = False
+        # Stop all managed services
+        for service, future in self._instances.items():
+            self._stop_instance(service, future)
+
+        # NOTE: Threads can't be killed, so stop() only returns after the
+        # grace period, while the interpreter exit still waits for stuck
+        # services since concurrent.futures joins its workers at exit.
+        _, not_done = futures.wait(
+            self._instances.values(), timeout=self._shutdown_grace
+        )
+        for service, future in self._instances.items():
+            if future in not_done:
+                LOG.warning(
+                    "Child service(%s) didn't stop in %.1fs, don't wait for it",
+                    service.__class__.__name__,
+                    self._shutdown_grace,
+                )
+        if self._pool is not None:
+            self._pool.shutdown(wait=not not_done)
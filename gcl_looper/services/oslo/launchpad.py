@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 import enum
+import functools
 import logging
 import typing as tp
 
@@ -88,18 +89,22 @@ class LaunchpadService(basic.BasicService, oslo_base.OsloConfigurableService):
             tuple[str, int]: Service class and count.
         """
 
-        if "::" in svc_str:
-            try:
-                svc, count_str = svc_str.split("::")
-                count = int(count_str)
-            except ValueError:
-                LOG.error("Invalid service format: %s", svc_str)
-                raise
-        else:
-            svc = svc_str
-            count = 1
+        svc, sep, count_str = svc_str.rpartition("::")
+        if not sep:
+            return svc_str, 1
+
+        try:
+            return svc, int(count_str)
+        except ValueError:
+            LOG.error("Invalid service format: %s", svc_str)
+            raise
 
-        return svc, count
+    @classmethod
+    def _svc_section_names(cls, svc: str, count: int) -> list[str]:
+        """Return config section names for each service instance."""
+        if count == 1:
+            return [svc]
+        return [f"{svc}::{i}" for i in range(count)]
 
     @classmethod
     def svc_get_config_opts(cls) -> tp.Collection[cfg.Opt]:
@@ -116,7 +121,13 @@ class LaunchpadService(basic.BasicService, oslo_base.OsloConfigurableService):
                 ),
             ]
         """
-        return [
+        return cls._opts()
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _opts(cls) -> tuple[cfg.Opt, ...]:
+        # Options are built once and shared by all calls
+        return (
             cfg.ListOpt(
                 "services",
                 default=tuple(),
@@ -176,7 +187,7 @@ class LaunchpadService(basic.BasicService, oslo_base.OsloConfigurableService):
                 default=0.1,
                 help="Pause between iterations",
             ),
-        ]
+        )
 
     @classmethod
     def from_cmd_line(cls, args: list[str]) -> "LaunchpadService":
@@ -213,18 +224,20 @@ class LaunchpadService(basic.BasicService, oslo_base.OsloConfigurableService):
 
             # Register service options
             if opts is not None:
+                opts = tuple(opts)
                 # Register options for each service instance
-                for i in range(count):
-                    section_name = f"{svc}::{i}" if count > 1 else svc
-                    cfg.CONF.register_cli_opts(opts, section_name)
+                for section_name in cls._svc_section_names(svc, count):
+                    group = cfg.OptGroup(section_name)
+                    cfg.CONF.register_group(group)
+                    cfg.CONF.register_cli_opts(opts, group)
 
                 services_classes.append(
-                    (svc, svc_class, ServiceType.OPS, count)
+                    (svc, svc_class, ServiceType.OPS, count, opts)
                 )
             # Allow to load configuration manually for the service
             else:
                 services_classes.append(
-                    (svc, svc_class, ServiceType.CONFIG, count)
+                    (svc, svc_class, ServiceType.CONFIG, count, None)
                 )
 
         # Use common initializer if specified
@@ -244,19 +257,17 @@ class LaunchpadService(basic.BasicService, oslo_base.OsloConfigurableService):
             )
             common_initializer(cfg.CONF)
 
+        known_sections = frozenset(cfg.CONF.list_all_sections())
+
         # Load services
-        for svc_name, svc_class, svc_type, count in services_classes:
+        for svc_name, svc_class, svc_type, count, opts in services_classes:
             # Loading services in according to the count
-            for i in range(count):
+            for section_name in cls._svc_section_names(svc_name, count):
                 if svc_type == ServiceType.CONFIG:
                     svc = svc_class.svc_from_config(launchpad_cfg.config_file)
                 elif svc_type == ServiceType.OPS:
-                    section_name = (
-                        f"{svc_name}::{i}" if count > 1 else svc_name
-                    )
-
                     # Check if configuration section exists
-                    if section_name not in cfg.CONF.list_all_sections():
+                    if section_name not in known_sections:
                         LOG.error(
                             "Section %s not found in config", section_name
                         )
@@ -265,7 +276,12 @@ class LaunchpadService(basic.BasicService, oslo_base.OsloConfigurableService):
                             f"`{svc_name}` not found in config"
                         )
 
-                    svc = svc_class(**cfg.CONF[section_name])
+                    # Take only the service's options, without going through
+                    # all options registered in the group
+                    group = cfg.CONF[section_name]
+                    svc = svc_class(
+                        **{o.dest: getattr(group, o.dest) for o in opts}
+                    )
                 else:
                     raise ValueError(f"Unknown service type: {svc_type}")
                 services.append(svc)
@@ -2,6 +2,7 @@ import multiprocessing
 import os
 import signal
 import time
+from unittest import mock
 
 import pytest
 
@@ -16,6 +17,10 @@ class OneTimeProcessHub(hub.ProcessHubService):
         return super()._iteration()
 
 
+class OneTimeInlineProcessHub(OneTimeProcessHub):
+    _inline_single_service = True
+
+
 class OneTimeThreadHub(hub.ThreadHubService):
     def _iteration(self):
         self._enabled = False
@@ -37,7 +42,8 @@ class ConcreteService(basic.BasicService):
 
 @pytest.fixture
 def prepared_service():
-    value = multiprocessing.Value("i", 0)
+    # Must match ProcessHubService's default start method to be shared
+    value = multiprocessing.get_context("forkserver").Value("i", 0)
     return ConcreteService(value)
 
 
@@ -49,6 +55,26 @@ def test_process_hub_service_initialization(prepared_service):
     assert len(h._instances) == 0
 
 
+def test_process_hub_service_mp_context_from_env(monkeypatch):
+    monkeypatch.setenv("GCL_LOOPER_MP_CONTEXT", "fork")
+    h = hub.ProcessHubService()
+
+    assert h._ctx.get_start_method() == "fork"
+
+
+def test_mp_preload_service_modules(prepared_service):
+    h = hub.ProcessHubService()
+    h.add_service(prepared_service)
+
+    with mock.patch.object(h._ctx, "set_forkserver_preload") as preload:
+        h._preload_service_modules()
+
+    preload.assert_called_once()
+    modules = preload.call_args[0][0]
+    assert ConcreteService.__module__ in modules
+    assert "gcl_looper.services.basic" in modules
+
+
 def test_mp_start_stop_services(prepared_service):
     h = OneTimeProcessHub()
     h.add_service(prepared_service)
@@ -69,6 +95,58 @@ def test_mp_start_stop_services(prepared_service):
     assert prepared_service._value.value == -1
 
 
+def test_mp_unpicklable_service_stops_started(prepared_service):
+    broken_service = ConcreteService(prepared_service._value)
+    broken_service.add_setup(lambda: None)
+    h = hub.ProcessHubService()
+    h.add_service(prepared_service)
+    h.add_service(broken_service)
+
+    with pytest.raises(Exception):
+        h.start()
+
+    assert list(h._instances) == [prepared_service]
+    assert not h._instances[prepared_service].is_alive()
+
+
+def test_mp_inline_single_service(prepared_service):
+    h = OneTimeInlineProcessHub()
+    h.add_service(prepared_service)
+
+    h.start()
+
+    assert h._single_inline
+    assert h._instances == {}
+    assert prepared_service._value.value == 1
+
+    h.stop()
+
+    assert prepared_service._value.value == -1
+
+
+class FiniteService(basic.BasicService):
+    def __init__(self, countdown):
+        super().__init__(iter_min_period=0, iter_pause=0)
+        self.countdown = countdown
+
+    def _iteration(self):
+        self.countdown -= 1
+        if self.countdown <= 0:
+            self.stop()
+
+
+def test_mp_inline_finite_service_stops_hub():
+    service = FiniteService(countdown=3)
+    h = hub.ProcessHubService(iter_min_period=0, iter_pause=0)
+    h._inline_single_service = True
+    h.add_service(service)
+
+    h.start()
+
+    assert service.countdown == 0
+    assert h._enabled == False
+
+
 def test_mp_service_died(prepared_service):
     h = OneTimeProcessHub()
     h.add_service(prepared_service)
@@ -97,11 +175,69 @@ def test_mt_start_stop_services(prepared_service):
 
     # Allow some iterations to run
     time.sleep(0.2)
-    assert instance.is_alive()
+    assert not instance.done()
 
     assert prepared_service._value.value > 2
+    assert prepared_service.should_subscribe_signals
 
     h.stop()
 
-    assert not instance.is_alive(), "Service did not stop gracefully"
+    assert instance.done(), "Service did not stop gracefully"
     assert prepared_service._value.value == -1
+
+
+def test_mt_hub_without_mp_context(prepared_service):
+    h = OneTimeThreadHub()
+    h.add_service(prepared_service)
+
+    h.start()
+    h.stop()
+
+    assert "_ctx" not in h.__dict__
+
+
+def test_mt_service_failed(prepared_service):
+    def failed_setup():
+        raise RuntimeError("Setup failed")
+
+    prepared_service.add_setup(failed_setup)
+    h = OneTimeThreadHub()
+    h.add_service(prepared_service)
+
+    h.start()
+    future = h._instances[prepared_service]
+    future.exception(timeout=1)
+
+    # Continue hub's loop to check if it handles the service failure
+    h._enabled = True
+    h._loop()
+
+    assert isinstance(future.exception(), RuntimeError)
+    assert h._enabled == False
+
+
+class StuckService(ConcreteService):
+    def start(self):
+        # Ignore SIGTERM to emulate a stuck child
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        while True:
+            time.sleep(0.05)
+
+
+def test_mp_stuck_service_killed():
+    value = multiprocessing.get_context("forkserver").Value("i", 0)
+    h = OneTimeProcessHub()
+    h._shutdown_grace = 0.5
+    h.add_service(StuckService(value))
+
+    h.start()
+    instance = h._instances[h._services[0]]
+    # Let the child ignore SIGTERM
+    time.sleep(0.5)
+
+    start_time = time.monotonic()
+    h.stop()
+
+    assert time.monotonic() - start_time < 5
+    assert not instance.is_alive()
+    assert instance.exitcode == -signal.SIGKILL
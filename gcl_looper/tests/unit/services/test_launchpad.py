@@ -16,12 +16,23 @@ class TestLaunchpadServiceParseAndOpts:
         assert launchpad.LaunchpadService._parse_svc_str(
             "pkg.mod:MyService"
         ) == ("pkg.mod:MyService", 1)
+        assert launchpad.LaunchpadService._parse_svc_str(
+            "pkg.mod:MyService::3"
+        ) == ("pkg.mod:MyService", 3)
 
     def test_parse_svc_str_invalid(self):
         with pytest.raises(ValueError):
-            # split will raise ValueError when more than one '::'
+            # the count part `C` isn't a number
             launchpad.LaunchpadService._parse_svc_str("A::B::C")
 
+    def test_svc_section_names(self):
+        assert launchpad.LaunchpadService._svc_section_names(
+            "MyService", 1
+        ) == ["MyService"]
+        assert launchpad.LaunchpadService._svc_section_names(
+            "MyService", 2
+        ) == ["MyService::0", "MyService::1"]
+
     def test_svc_get_config_opts_contains_expected(self):
         opts = launchpad.LaunchpadService.svc_get_config_opts()
         names = {o.name for o in opts}
@@ -34,6 +45,12 @@ class TestLaunchpadServiceParseAndOpts:
             "iter_pause",
         }.issubset(names)
 
+    def test_svc_get_config_opts_cached(self):
+        assert (
+            launchpad.LaunchpadService.svc_get_config_opts()
+            is launchpad.LaunchpadService.svc_get_config_opts()
+        )
+
     def test_load_config_ok_with_config_file(self, tmp_path):
         cfg_file = tmp_path / "conf.ini"
         cfg_file.write_text("")
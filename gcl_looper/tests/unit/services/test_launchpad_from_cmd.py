@@ -221,3 +221,152 @@ def test_common_handlers_called(monkeypatch, tmp_path):
     )
 
     assert calls == {"reg": 1, "init": 1}
+
+
+def test_common_registrator_cli_opts_loaded(monkeypatch, tmp_path):
+    values = []
+
+    def reg(conf):
+        conf.register_cli_opts([cfg.StrOpt("connection")], "db")
+
+    def init(conf):
+        values.append(conf.db.connection)
+
+    def cfg_loader(path):
+        if path.endswith(":reg"):
+            return reg
+        if path.endswith(":init"):
+            return init
+        return OpsSvc
+
+    monkeypatch.setattr(
+        "gcl_looper.utils.cfg_load_module_attr",
+        cfg_loader,
+    )
+
+    ini = make_cfg(
+        tmp_path,
+        f"""
+        [launchpad]
+        services = mock.module:OpsSvc
+        common_registrator_opts = mock.module:reg
+        common_initializer = mock.module:init
+
+        [mock.module:OpsSvc]
+        param = abc
+        num = 1
+
+        [db]
+        connection = sqlite://
+        """,
+    )
+
+    launchpad.LaunchpadService.from_cmd_line(["--config-file", ini])
+
+    assert values == ["sqlite://"]
+
+
+def test_common_registrator_opts_loaded(monkeypatch, tmp_path):
+    values = []
+
+    def reg(conf):
+        conf.register_opts([cfg.StrOpt("connection")], "db")
+
+    def init(conf):
+        values.append(conf.db.connection)
+
+    def cfg_loader(path):
+        if path.endswith(":reg"):
+            return reg
+        if path.endswith(":init"):
+            return init
+        return OpsSvc
+
+    monkeypatch.setattr(
+        "gcl_looper.utils.cfg_load_module_attr",
+        cfg_loader,
+    )
+
+    ini = make_cfg(
+        tmp_path,
+        f"""
+        [launchpad]
+        services = mock.module:OpsSvc
+        common_registrator_opts = mock.module:reg
+        common_initializer = mock.module:init
+
+        [mock.module:OpsSvc]
+        param = abc
+        num = 1
+
+        [db]
+        connection = sqlite://
+        """,
+    )
+
+    launchpad.LaunchpadService.from_cmd_line(["--config-file", ini])
+
+    assert values == ["sqlite://"]
+
+
+def test_only_service_opts_passed(monkeypatch, tmp_path):
+    def reg(conf):
+        # An extra option in the service's section
+        conf.register_opts([cfg.StrOpt("extra")], "mock.module:OpsSvc")
+
+    def cfg_loader(path):
+        if path.endswith(":reg"):
+            return reg
+        return OpsSvc
+
+    monkeypatch.setattr(
+        "gcl_looper.utils.cfg_load_module_attr",
+        cfg_loader,
+    )
+
+    ini = make_cfg(
+        tmp_path,
+        f"""
+        [launchpad]
+        services = mock.module:OpsSvc
+        common_registrator_opts = mock.module:reg
+
+        [mock.module:OpsSvc]
+        param = only
+        num = 5
+        extra = value
+        """,
+    )
+
+    launchpad.LaunchpadService.from_cmd_line(["--config-file", ini])
+
+    assert OpsSvc.created[-1] == ("only", 5)
+
+
+def test_service_opts_registered_as_cli(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        "gcl_looper.utils.cfg_load_module_attr",
+        lambda path: OpsSvc,
+    )
+
+    ini = make_cfg(
+        tmp_path,
+        f"""
+        [launchpad]
+        services = mock.module:OpsSvc
+
+        [mock.module:OpsSvc]
+        param = abc
+        num = 1
+        """,
+    )
+
+    launchpad.LaunchpadService.from_cmd_line(["--config-file", ini])
+
+    cli_opts = {
+        (group.name, opt.dest)
+        for opt, group in cfg.CONF._all_cli_opts()
+        if group is not None
+    }
+    assert ("mock.module:OpsSvc", "param") in cli_opts
+    assert ("mock.module:OpsSvc", "num") in cli_opts
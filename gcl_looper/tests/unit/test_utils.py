@@ -0,0 +1,119 @@
+#    Copyright 2025 Genesis Corporation.
+#
+#    All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+import os
+
+import pytest
+from unittest import mock
+
+from gcl_looper import utils
+from gcl_looper.services import basic
+
+
+class TestCfgLoadModuleAttr:
+    def test_load_ok(self):
+        attr = utils.cfg_load_module_attr(
+            "gcl_looper.services.basic:BasicService"
+        )
+
+        assert attr is basic.BasicService
+
+    def test_invalid_path(self):
+        with pytest.raises(ValueError):
+            utils.cfg_load_module_attr("gcl_looper.services.basic")
+
+    def test_module_not_found(self):
+        with pytest.raises(ValueError):
+            utils.cfg_load_module_attr("gcl_looper.not_exists:Service")
+
+    def test_attr_not_found(self):
+        with pytest.raises(ValueError):
+            utils.cfg_load_module_attr("gcl_looper.services.basic:NotExists")
+
+
+class TestCfgLoadSectionMap:
+    def test_load_ok(self, tmp_path):
+        cfg_file = tmp_path / "conf.ini"
+        cfg_file.write_text(
+            "[DEFAULT]\ndebug = True\n\n[section]\noption1 = value1\n"
+        )
+
+        params = utils.cfg_load_section_map(str(cfg_file), "section")
+
+        assert params == {"option1": "value1"}
+
+    def test_file_changed(self, tmp_path):
+        cfg_file = tmp_path / "conf.ini"
+        cfg_file.write_text("[section]\noption1 = value1\n")
+        utils.cfg_load_section_map(str(cfg_file), "section")
+
+        cfg_file.write_text("[section]\noption1 = value2\n")
+        stat = cfg_file.stat()
+        os.utime(cfg_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        params = utils.cfg_load_section_map(str(cfg_file), "section")
+
+        assert params == {"option1": "value2"}
+
+    def test_no_section(self, tmp_path):
+        cfg_file = tmp_path / "conf.ini"
+        cfg_file.write_text("[section]\noption1 = value1\n")
+
+        assert utils.cfg_load_section_map(str(cfg_file), "other") == {}
+
+    def test_no_file(self, tmp_path):
+        cfg_file = tmp_path / "conf.ini"
+
+        assert utils.cfg_load_section_map(str(cfg_file), "section") == {}
+
+    def test_unreadable_file(self, tmp_path):
+        assert utils.cfg_load_section_map(str(tmp_path), "section") == {}
+
+
+class TestLoadFromEntryPoint:
+    def setup_method(self):
+        utils._ep_table.cache_clear()
+
+    def teardown_method(self):
+        utils._ep_table.cache_clear()
+
+    @mock.patch("importlib_metadata.entry_points")
+    def test_load_ok(self, entry_points):
+        ep = mock.MagicMock()
+        ep.name = "MyService"
+        entry_points.return_value = [ep]
+
+        attr = utils.load_from_entry_point("group", "MyService")
+        utils.load_from_entry_point("group", "MyService")
+
+        assert attr is ep.load.return_value
+        entry_points.assert_called_once_with(group="group")
+
+    @mock.patch("importlib_metadata.entry_points")
+    def test_load_duplicated_name(self, entry_points):
+        first_ep = mock.MagicMock()
+        first_ep.name = "MyService"
+        second_ep = mock.MagicMock()
+        second_ep.name = "MyService"
+        entry_points.return_value = [first_ep, second_ep]
+
+        attr = utils.load_from_entry_point("group", "MyService")
+
+        assert attr is first_ep.load.return_value
+        second_ep.load.assert_not_called()
+
+    @mock.patch("importlib_metadata.entry_points", return_value=[])
+    def test_not_found(self, entry_points):
+        with pytest.raises(RuntimeError):
+            utils.load_from_entry_point("group", "MyService")
@@ -15,11 +15,27 @@
 #    under the License.
 from __future__ import annotations
 
+import os
 import sys
+import functools
 import importlib
 import typing as tp
-import configparser
-import importlib_metadata
+
+# configparser and importlib_metadata are imported lazily, they are heavy
+# and not needed by most users of this module (e.g. forkserver children)
+if tp.TYPE_CHECKING:
+    import configparser
+
+    import importlib_metadata
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_module_attr(attr_path: str) -> tp.Any:
+    module_path, attr_name = attr_path.split(":", 1)
+    module = sys.modules.get(module_path) or importlib.import_module(
+        module_path
+    )
+    return getattr(module, attr_name)
 
 
 def cfg_load_module_attr(attr_path: str) -> tp.Any:
@@ -31,25 +47,27 @@ def cfg_load_module_attr(attr_path: str) -> tp.Any:
     if ":" not in attr_path:
         raise ValueError(f"Invalid model path: {attr_path}")
 
-    module_path, attr_name = attr_path.split(":", 1)
-
-    # Import the module if it's not already loaded
-    if module_path not in sys.modules:
-        try:
-            module = importlib.import_module(module_path)
-        except ImportError:
-            raise ValueError(f"Module {module_path} not found")
-    else:
-        module = sys.modules[module_path]
-
     try:
-        attr = getattr(module, attr_name)
+        return _resolve_module_attr(attr_path)
+    except ImportError:
+        module_path = attr_path.split(":", 1)[0]
+        raise ValueError(f"Module {module_path} not found")
     except AttributeError:
+        module_path, attr_name = attr_path.split(":", 1)
         raise ValueError(
             f"Attribute {attr_name} not found in module {module_path}"
         )
 
-    return attr
+
+@functools.lru_cache(maxsize=32)
+def _parsed_ini(path: str, mtime_ns: int) -> configparser.ConfigParser:
+    # `mtime_ns` is a part of the cache key to reparse modified files
+    import configparser
+
+    parser = configparser.ConfigParser()
+    with open(path) as f:
+        parser.read_file(f)
+    return parser
 
 
 def cfg_load_section_map(config_file: str, section: str) -> dict[str, str]:
@@ -62,26 +80,35 @@ def cfg_load_section_map(config_file: str, section: str) -> dict[str, str]:
 
     Returns: {"option1": "value1", "option2": "value2"}
     """
-    params = {}
-    parser = configparser.ConfigParser()
-    parser.read(config_file)
+    # Unreadable files are skipped the same way as ConfigParser.read() does
+    try:
+        mtime_ns = os.stat(config_file).st_mtime_ns
+        parser = _parsed_ini(config_file, mtime_ns)
+    except OSError:
+        return {}
 
     if not parser.has_section(section):
-        return params
+        return {}
+
+    defaults = parser.defaults()
+    return {k: v for k, v in parser.items(section) if k not in defaults}
 
-    for option in parser.options(section):
-        if option in parser.defaults():
-            continue
 
-        params[option] = parser.get(section, option)
+@functools.lru_cache(maxsize=None)
+def _ep_table(group: str) -> dict[str, importlib_metadata.EntryPoint]:
+    import importlib_metadata
 
-    return params
+    table = {}
+    for ep in importlib_metadata.entry_points(group=group):
+        # The first found entry point wins for duplicated names
+        table.setdefault(ep.name, ep)
+    return table
 
 
 def load_from_entry_point(group: str, name: str) -> tp.Any:
     """Load class from entry points."""
-    for ep in importlib_metadata.entry_points(group=group):
-        if ep.name == name:
-            return ep.load()
+    ep = _ep_table(group).get(name)
+    if ep is None:
+        raise RuntimeError(f"No class '{name}' found in entry points {group}")
 
-    raise RuntimeError(f"No class '{name}' found in entry points {group}")
+    return ep.load()